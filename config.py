@@ -3,11 +3,30 @@ from enum import Enum, auto
 # Simulation / UI toggles
 SIMULATE_HUB = False  # skip real BLE connection if True
 ENABLE_RICH_LOG = False  # terminal live table
+UI_REFRESH_INTERVAL = 0.1  # seconds between live table updates (10 Hz)
+STATUS_LOG_INTERVAL = 0.5  # seconds between status log lines when the live table is off
 
 # Deadzones
 DEADZONE_STICK = 8
 DEADZONE_TRIGGER = 5 
 
+# Control loop period (seconds)
+CONTROL_LOOP_INTERVAL = 0.02
+
+# BLE connection interval requested on Linux, in 1.25 ms units (6..12 = 7.5..15 ms)
+BLE_CONN_INTERVAL_MIN = 6
+BLE_CONN_INTERVAL_MAX = 12
+BLE_MTU = 247  # ATT MTU requested after connect where the backend supports it
+BLE_MIN_WRITE_INTERVAL = 0.02  # seconds between drive writes; newer commands coalesce meanwhile
+
+# Rolling average window (seconds) for the "2min" power average
+AVG_WINDOW_SECONDS = 120
+
+# Telemetry: frames are batched into one websocket message per interval (seconds)
+TELEMETRY_BATCH_INTERVAL = 0.1
+# Unchanged telemetry frames are skipped, but one is still sent at least this often (seconds)
+TELEMETRY_HEARTBEAT = 0.2
+
 # Mode definitions
 class Mode(Enum):
     COMFORT = "Comfort"
@@ -23,6 +42,13 @@ SMOOTH_ALPHA_BRAKE = {
     Mode.SPORT: 0.35,
 }
 
+# Smoothing factors above are tuned for a 10 ms tick
+SMOOTH_TUNING_INTERVAL = 0.01
+
+def rescale_alpha(alpha: float, interval: float) -> float:
+    # same time constant at a different tick length
+    return 1 - (1 - alpha) ** (interval / SMOOTH_TUNING_INTERVAL)
+
 # Gear definitions (only forward)
 class Gear(Enum):
     FIRST = auto()
@@ -36,6 +62,13 @@ GEAR_THROTTLE_SCALE = {
     Gear.THIRD: 1.0,
 }
 
+# Rumble feedback on gear change: (low, high, duration_ms)
+GEAR_RUMBLE = {
+    Gear.FIRST: (0.1, 0.1, 150),
+    Gear.SECOND: (0.2, 0.2, 200),
+    Gear.THIRD: (0.4, 0.4, 250),
+}
+
 # Reverse scale per gear (negative)
 REVERSE_SCALE_PER_GEAR = {
     Gear.FIRST: -0.15,
@@ -43,8 +76,14 @@ REVERSE_SCALE_PER_GEAR = {
     Gear.THIRD: -0.5,
 }
 
-def compute_light_code(is_braking: bool, lights_enabled: bool) -> int:
-    if is_braking:
-        return 0x01 if lights_enabled else 0x05
-    else:
-        return 0x00 if lights_enabled else 0x04
+# Per-gear values indexed by position in GEAR_ORDER, for the control loop
+GEAR_SCALES = tuple(GEAR_THROTTLE_SCALE[g] for g in GEAR_ORDER)
+REVERSE_SCALES = tuple(REVERSE_SCALE_PER_GEAR[g] for g in GEAR_ORDER)
+
+# Light codes keyed by (is_braking, lights_enabled)
+LIGHT_CODE = {
+    (False, False): 0x04,
+    (False, True): 0x00,
+    (True, False): 0x05,
+    (True, True): 0x01,
+}
@@ -1,15 +1,33 @@
 import asyncio
 import time
 import logging
+import os
 import sys
 from collections import deque
+from dataclasses import dataclass
 import json
 
+try:
+    import msgspec
+except ImportError:  # optional, telemetry falls back to JSON
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib encoder
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # optional, POSIX only
+    uvloop = None
+
 import pygame
 from bleak import BleakScanner, BleakClient
 from rich.live import Live
 from rich.table import Table
 from rich.panel import Panel
+from rich.text import Text
 from fastapi import FastAPI, WebSocket
 from fastapi.staticfiles import StaticFiles
 from uvicorn import Config, Server
@@ -17,16 +35,27 @@ from uvicorn import Config, Server
 from config import (
     SIMULATE_HUB,
     ENABLE_RICH_LOG,
+    STATUS_LOG_INTERVAL,
+    UI_REFRESH_INTERVAL,
     DEADZONE_STICK,
     DEADZONE_TRIGGER,
     Mode,
     SMOOTH_ALPHA_ACCEL,
     SMOOTH_ALPHA_BRAKE,
+    CONTROL_LOOP_INTERVAL,
+    rescale_alpha,
     GEAR_ORDER,
-    GEAR_THROTTLE_SCALE,
-    REVERSE_SCALE_PER_GEAR,
-    Gear,
-    compute_light_code,
+    GEAR_SCALES,
+    REVERSE_SCALES,
+    GEAR_RUMBLE,
+    LIGHT_CODE,
+    TELEMETRY_BATCH_INTERVAL,
+    TELEMETRY_HEARTBEAT,
+    AVG_WINDOW_SECONDS,
+    BLE_CONN_INTERVAL_MIN,
+    BLE_CONN_INTERVAL_MAX,
+    BLE_MTU,
+    BLE_MIN_WRITE_INTERVAL,
 )
 
 # ---------- logging ----------
@@ -38,38 +67,75 @@ handler.setFormatter(
 )
 logger.addHandler(handler)
 
+# the live table is pointless when output is piped or headless; fall back to log lines
+USE_TUI = ENABLE_RICH_LOG and sys.stdout.isatty() and not os.environ.get("NO_TUI")
+
 # ---------- telemetry backend ----------
 app = FastAPI()
 app.mount("/static", StaticFiles(directory="static"), name="static")
-clients: set[WebSocket] = set()
+# each client gets a small outbound queue drained by its own sender task
+clients: dict[WebSocket, asyncio.Queue] = {}
+CLIENT_QUEUE_SIZE = 2
+
+
+async def _telemetry_sender(websocket: WebSocket, queue: asyncio.Queue):
+    try:
+        while True:
+            msg = await queue.get()
+            await websocket.send_bytes(msg)
+    except Exception:
+        clients.pop(websocket, None)
 
 
 @app.websocket("/ws/telemetry")
 async def telemetry_ws(websocket: WebSocket):
     await websocket.accept()
-    clients.add(websocket)
+    queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+    clients[websocket] = queue
+    sender = asyncio.create_task(_telemetry_sender(websocket, queue))
     try:
+        # blocks until the client goes away, so closed sockets are dropped right away;
+        # inbound frames of any type are ignored
         while True:
-            await asyncio.sleep(1)
-    except Exception:
-        pass
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
     finally:
-        clients.discard(websocket)
+        clients.pop(websocket, None)
+        sender.cancel()
+
+
+_msgpack_encoder = msgspec.msgpack.Encoder() if msgspec is not None else None
+
 
+def encode_telemetry(data: dict) -> bytes:
+    # msgpack when available, JSON otherwise; the dashboard accepts both
+    if _msgpack_encoder is not None:
+        return _msgpack_encoder.encode(data)
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
 
-async def broadcast_telemetry(data: dict):
-    payload = json.dumps(data)
-    stale = []
-    for ws in list(clients):
+
+def broadcast_telemetry(data: dict):
+    if not clients:
+        return
+    payload = encode_telemetry(data)
+    # no await below, so clients can't change mid-iteration and no snapshot copy is needed
+    for queue in clients.values():
+        # slow clients only ever see the latest frames
         try:
-            await ws.send_text(payload)
-        except Exception:
-            stale.append(ws)
-    for s in stale:
-        clients.discard(s)
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            queue.get_nowait()
+            queue.put_nowait(payload)
 
 
 # ---------- Hub class ----------
+_CALIB_STEP_1 = bytes.fromhex("0d008136115100030000001000")
+_CALIB_STEP_2 = bytes.fromhex("0d008136115100030000000800")
+
+
 class TechnicMoveHub:
     CHAR_UUID = "00001624-1212-EFDE-1623-785FEABCD123"
     LIGHTS_OFF_OFF = 0b100
@@ -79,32 +145,78 @@ class TechnicMoveHub:
     def __init__(self, device_name):
         self.device_name = device_name
         self.client = None
-        self._start_time = None
+        self.connected = False  # kept current by the disconnect callback
+        self._char = None
+        self._write_response = False
+        self.mtu = 23  # ATT default until negotiated
+        self._start_time_ns = 0
         self.simulate = SIMULATE_HUB
+        # latest-value-wins drive command, flushed by run_writer
+        self._pending = None
+        self._pending_event = asyncio.Event()
+        # drive command template; speed/angle/lights are patched into bytes 9..11
+        self._drive_payload = bytearray(b"\x0d\x00\x81\x36\x11\x51\x00\x03\x00\x00\x00\x00\x00")
 
     async def calibrate_steering(self):
         # steering calibration sequence
-        await self.send_data(bytes.fromhex("0d008136115100030000001000"))
+        await self.send_data(_CALIB_STEP_1)
         await asyncio.sleep(0.1)
-        await self.send_data(bytes.fromhex("0d008136115100030000000800"))
+        await self.send_data(_CALIB_STEP_2)
         await asyncio.sleep(0.1)
 
+    def request_connection_interval(self):
+        # BlueZ applies these debugfs defaults to new LE connections; needs root,
+        # otherwise the peripheral's default interval is kept
+        if not sys.platform.startswith("linux"):
+            return
+        settings = (
+            ("conn_min_interval", BLE_CONN_INTERVAL_MIN),
+            ("conn_max_interval", BLE_CONN_INTERVAL_MAX),
+        )
+        try:
+            for name, value in settings:
+                with open(f"/sys/kernel/debug/bluetooth/hci0/{name}", "w") as f:
+                    f.write(str(value))
+        except OSError as e:
+            logger.debug(f"Keeping default connection interval: {e}")
+
+    async def negotiate_mtu(self):
+        # bleak has no portable MTU request; use what the backend offers
+        backend = getattr(self.client, "_backend", None)
+        try:
+            if hasattr(self.client, "request_mtu"):
+                await self.client.request_mtu(BLE_MTU)
+            elif hasattr(backend, "_acquire_mtu"):
+                await backend._acquire_mtu()
+        except Exception as e:
+            logger.debug(f"MTU exchange failed: {e}")
+        self.mtu = getattr(self.client, "mtu_size", self.mtu)
+        logger.info(f"ATT MTU: {self.mtu}")
+
     async def scan_and_connect(self):
         if self.simulate:
             logger.info("[SIMULATION] skipping BLE connect")
-            self._start_time = time.time()
+            self._start_time_ns = time.monotonic_ns()
             return True
         logger.info(f"Searching for Technic Move Hub '{self.device_name}'...")
         try:
-            devices = await BleakScanner.discover(timeout=5)
+            # returns as soon as the hub advertises instead of waiting out the timeout
+            target = await BleakScanner.find_device_by_filter(
+                lambda d, ad: bool(d.name and self.device_name in d.name),
+                timeout=5,
+            )
         except Exception as e:
             logger.error(f"BLE scan failed: {e}")
             return False
-        target = next((d for d in devices if d.name and self.device_name in d.name), None)
         if not target:
             logger.error("Device not found")
             return False
-        self.client = BleakClient(address_or_ble_device=target, pair=True)
+        self.client = BleakClient(
+            address_or_ble_device=target,
+            pair=True,
+            disconnected_callback=self._on_disconnect,
+        )
+        self.request_connection_interval()
         try:
             await self.client.connect()
         except Exception as e:
@@ -117,56 +229,75 @@ class TechnicMoveHub:
             await self.client.pair(protection_level=2)
         except Exception:
             pass
-        self._start_time = time.time()
+        await self.negotiate_mtu()
+        # resolve the characteristic once so writes skip the UUID lookup
+        self._char = self.client.services.get_characteristic(self.CHAR_UUID)
+        if self._char is None:
+            logger.error("Hub characteristic not found")
+            return False
+        self._write_response = "write-without-response" not in self._char.properties
+        if self._write_response:
+            logger.warning("Hub characteristic lacks write-without-response; writes will wait for ACK")
+        self._start_time_ns = time.monotonic_ns()
+        self.connected = True
         logger.info("Connected to hub")
         return True
 
+    def _on_disconnect(self, client):
+        self.connected = False
+        logger.warning("Hub disconnected")
+
     async def send_data(self, data: bytes):
         if self.simulate:
             return
-        if not self.client or not getattr(self.client, "is_connected", False):
+        if not self.connected:
             logger.warning("No active BLE client")
             return
         try:
-            await self.client.write_gatt_char(self.CHAR_UUID, data)
+            await self.client.write_gatt_char(self._char, data, response=self._write_response)
         except Exception as e:
             logger.error(f"Send failed: {e}")
 
     async def drive(self, speed=0, angle=0, lights=0x00):
         speed = int(speed)
         angle = int(angle)
-        payload = bytearray(
-            [
-                0x0d,
-                0x00,
-                0x81,
-                0x36,
-                0x11,
-                0x51,
-                0x00,
-                0x03,
-                0x00,
-                speed & 0xFF,
-                angle & 0xFF,
-                lights & 0xFF,
-                0x00,
-            ]
-        )
-        logger.debug(f"drive payload speed={speed} angle={angle} lights=0x{lights:02x}")
+        payload = self._drive_payload
+        payload[9] = speed & 0xFF
+        payload[10] = angle & 0xFF
+        payload[11] = lights & 0xFF
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("drive payload speed=%d angle=%d lights=0x%02x", speed, angle, lights)
+        # drive() calls are serialized by the writer task, so the template can be sent as-is
         await self.send_data(payload)
 
+    def request_drive(self, speed=0, angle=0, lights=0x00):
+        # never blocks: commands issued while a write is in flight are coalesced
+        self._pending = (speed, angle, lights)
+        self._pending_event.set()
+
+    async def run_writer(self):
+        last_write = 0.0
+        while True:
+            await self._pending_event.wait()
+            wait = last_write + BLE_MIN_WRITE_INTERVAL - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._pending_event.clear()
+            last_write = time.monotonic()
+            await self.drive(*self._pending)
+
 
 # ---------- helpers ----------
-def apply_deadzone(value, dz):
-    return 0 if abs(value) < dz else value
+# 80% stick equals full turn
+STEERING_GAIN = 100 / 80
 
+# pygame axis ids: left x/y, right x/y, left/right trigger
+AXIS_IDS = range(6)
 
-def scale_steering(raw):
-    # 80% stick equals full turn
-    limit = 80
-    if abs(raw) <= limit:
-        return int((raw / limit) * 100)
-    return 100 if raw > 0 else -100
+# button bits in the packed button state (bit i = pygame button i)
+BUTTON_NAMES = ("A", "B", "X", "Y", "LB", "RB")
+BTN_A, BTN_B, BTN_X, BTN_Y, BTN_LB, BTN_RB = (1 << i for i in range(len(BUTTON_NAMES)))
+ALL_BUTTONS = (1 << len(BUTTON_NAMES)) - 1
 
 
 def enforce_vehicle_deadzone(power: float, inner_deadzone=10):
@@ -177,54 +308,93 @@ def enforce_vehicle_deadzone(power: float, inner_deadzone=10):
     return power
 
 
-def gear_name(g):
-    return {
-        Gear.FIRST: "1st",
-        Gear.SECOND: "2nd",
-        Gear.THIRD: "3rd",
-    }[g]
-
-
-def build_status_table(
-    raw,
-    command,
-    connected,
-    simulate,
-    lights_enabled,
-    brake,
-    gear,
-    lights_code,
-    power_sent,
-    instant_power,
-    avg_power_full,
-    avg_2min,
-    mode,
-):
+GEAR_NAMES = ("1st", "2nd", "3rd")  # indexed like GEAR_ORDER
+
+
+def shift_gear(delta, gear_idx, joystick):
+    gear_idx = max(0, min(len(GEAR_ORDER) - 1, gear_idx + delta))
+    joystick.rumble(*GEAR_RUMBLE[GEAR_ORDER[gear_idx]])
+    return gear_idx
+
+
+@dataclass(slots=True)
+class RawState:
+    # latest processed gamepad inputs, mutated in place by the controller loop
+    left_x: int = 0
+    left_y: int = 0
+    right_x: int = 0
+    right_y: int = 0
+    lt: int = 0
+    rt: int = 0
+    buttons: int = 0
+
+
+STATUS_ROWS = (
+    "Left stick",
+    "Right stick",
+    "Triggers",
+    "Buttons",
+    "Drive Command",
+    "Power Sent",
+    "Full Avg Power",
+    "2min Avg Power",
+    "Brake Active",
+    "Lights Enabled",
+    "Current Gear",
+    "Mode",
+    "Hub Status",
+)
+
+
+def build_status_table():
+    # built once; the value cells are Text objects mutated by update_status_cells
     table = Table(expand=True)
     table.add_column("Metric", no_wrap=True)
     table.add_column("Value", overflow="fold")
+    cells = []
+    for label in STATUS_ROWS:
+        cell = Text()
+        table.add_row(label, cell)
+        cells.append(cell)
+    return table, cells
+
+
+def update_status_cells(cells, raw: RawState, frame: dict, connected, simulate):
+    lights_code = LIGHT_CODE[(frame["brake"], frame["lights"])]
+    values = (
+        f"x={raw.left_x} y={raw.left_y}",
+        f"x={raw.right_x} y={raw.right_y}",
+        f"L={raw.lt} R={raw.rt}",
+        ", ".join(f"{name}:{(raw.buttons >> i) & 1}" for i, name in enumerate(BUTTON_NAMES)),
+        f"instant={frame['instant_power']:.1f} smoothed={frame['power']} "
+        f"angle={frame['angle']} lights=0x{lights_code:02x}",
+        str(frame["power"]),
+        f"{frame['avg_power_full']:.1f}",
+        f"{frame['avg_2min']:.1f}",
+        str(bool(frame["brake"])),
+        "ON" if frame["lights"] else "OFF",
+        frame["gear"],
+        frame["mode"],
+        "SIMULATED" if simulate else ("Connected" if connected else "Disconnected"),
+    )
+    for cell, value in zip(cells, values):
+        cell.plain = value
+
 
-    left = f"x={raw['left'][0]} y={raw['left'][1]}"
-    right = f"x={raw['right'][0]} y={raw['right'][1]}"
-    triggers = f"L={raw['triggers'][0]} R={raw['triggers'][1]}"
-    buttons = ", ".join(f"{k}:{int(v)}" for k, v in raw["buttons"].items())
-
-    table.add_row("Left stick", left)
-    table.add_row("Right stick", right)
-    table.add_row("Triggers", triggers)
-    table.add_row("Buttons", buttons if buttons else "(none)")
-    cmd = f"instant={instant_power:.1f} smoothed={power_sent} angle={command['angle']} lights=0x{lights_code:02x}"
-    table.add_row("Drive Command", cmd)
-    table.add_row("Power Sent", str(power_sent))
-    table.add_row("Full Avg Power", f"{avg_power_full:.1f}")
-    table.add_row("2min Avg Power", f"{avg_2min:.1f}")
-    table.add_row("Brake Active", str(bool(brake)))
-    table.add_row("Lights Enabled", "ON" if lights_enabled else "OFF")
-    table.add_row("Current Gear", gear_name(gear))
-    table.add_row("Mode", mode)
-    conn = "SIMULATED" if simulate else ("Connected" if connected else "Disconnected")
-    table.add_row("Hub Status", conn)
-    return table
+async def status_ui_loop(hub, raw: RawState, ui_state: dict):
+    # renders the latest frame published by the controller loop at its own rate;
+    # no auto-refresh thread, so cells are only mutated and drawn on this loop, and only on change
+    table, cells = build_status_table()
+    panel = Panel(table, title="Gamepad → Vehicle", border_style="green")
+    with Live(panel, auto_refresh=False, transient=False) as live:
+        last_frame = None
+        while True:
+            frame = ui_state["frame"]
+            if frame is not None and frame is not last_frame:
+                update_status_cells(cells, raw, frame, connected=hub.connected, simulate=hub.simulate)
+                live.refresh()
+                last_frame = frame
+            await asyncio.sleep(UI_REFRESH_INTERVAL)
 
 
 # ---------- main loop ----------
@@ -239,8 +409,11 @@ async def controller_loop():
     if not connected:
         return
 
-    pygame.init()
+    # only the subsystems the gamepad needs: the event queue (display) and joysticks
+    pygame.display.init()
     pygame.joystick.init()
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.JOYAXISMOTION, pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP])
     if pygame.joystick.get_count() == 0:
         logger.error("No joystick detected.")
         return
@@ -252,230 +425,283 @@ async def controller_loop():
 
     # initial state
     lights_enabled = True
-    toggle_old = False
+    buttons_old = 0
+    last_input_sig = None
     gear_idx = 0
-    current_gear = GEAR_ORDER[gear_idx]
+    gear_label = GEAR_NAMES[gear_idx]
+    forward_scale = GEAR_SCALES[gear_idx]
+    reverse_scale = REVERSE_SCALES[gear_idx]
     throttle_old = 0
-    steering_old = 0
-    lights_old_code = compute_light_code(False, lights_enabled)
-    was_brake = False
+    last_drive_key = -1
     current_mode_enum = Mode.COMFORT
     mode = current_mode_enum.value
     smoothed_power = 0.0
+    alpha_accel_per_mode = {m: rescale_alpha(a, CONTROL_LOOP_INTERVAL) for m, a in SMOOTH_ALPHA_ACCEL.items()}
+    alpha_brake_per_mode = {m: rescale_alpha(a, CONTROL_LOOP_INTERVAL) for m, a in SMOOTH_ALPHA_BRAKE.items()}
+    alpha_accel = alpha_accel_per_mode[current_mode_enum]
+    alpha_brake = alpha_brake_per_mode[current_mode_enum]
 
-    power_history_full = []
+    avg_power_full = 0.0
+    full_count = 0
     recent_history = deque()
-
-    raw = {"left": (0, 0), "right": (0, 0), "triggers": (0, 0), "buttons": {}}
-    command = {"speed": 0, "angle": 0, "raw_throttle": 0}
-
-    live_ctx = Live(refresh_per_second=10, transient=False) if ENABLE_RICH_LOG else None
-    if ENABLE_RICH_LOG:
-        live_ctx.__enter__()
+    recent_sum = 0.0
+    pending_frames = []
+    last_batch_t = 0.0
+    last_frame_sig = None
+    last_frame_t = 0.0
+    last_log_t = 0.0
+
+    raw = RawState()
+    ui_state = {"frame": None}
+
+    # joystick state is read once here and then kept current from pygame events
+    pygame.event.pump()
+    axes = [joystick.get_axis(i) for i in AXIS_IDS]
+    buttons_bits = 0
+    for i in range(len(BUTTON_NAMES)):
+        if joystick.get_button(i):
+            buttons_bits |= 1 << i
+
+    axes_dirty = True
+
+    # bind hot callables to locals once; the loop body uses LOAD_FAST lookups
+    _time = time.monotonic
+    _get_events = pygame.event.get
+    _round = round
 
     try:
-        while True:
-            pygame.event.pump()
-
-            # sticks with controller deadzone
-            left_x = apply_deadzone(round(joystick.get_axis(0) * 100), DEADZONE_STICK)
-            left_y = apply_deadzone(-round(joystick.get_axis(1) * 100), DEADZONE_STICK)
-            right_x = apply_deadzone(round(joystick.get_axis(2) * 100), DEADZONE_STICK)
-            right_y = apply_deadzone(-round(joystick.get_axis(3) * 100), DEADZONE_STICK)
-
-            # raw trigger values [0..100]
-            left_trigger_raw = (joystick.get_axis(4) * 100 + 100) / 2
-            right_trigger_raw = (joystick.get_axis(5) * 100 + 100) / 2
-
-            # buttons
-            buttons = {
-                "A": joystick.get_button(0),
-                "B": joystick.get_button(1),
-                "X": joystick.get_button(2),
-                "Y": joystick.get_button(3),
-                "LB": joystick.get_button(4),
-                "RB": joystick.get_button(5),
-            }
-
-            # mode toggle on X rising edge
-            if buttons["X"] and not raw["buttons"].get("X", 0):
-                current_mode_enum = Mode.SPORT if current_mode_enum == Mode.COMFORT else Mode.COMFORT
-                mode = current_mode_enum.value
-                logger.info(f"Mode switched to {mode}")
-
-            # gear shifting
-            if buttons["LB"] and not raw["buttons"].get("LB", 0):
-                gear_idx = max(0, gear_idx - 1)
-                current_gear = GEAR_ORDER[gear_idx]
-                if current_gear == Gear.FIRST:
-                    joystick.rumble(0.1, 0.1, 150)
-                elif current_gear == Gear.SECOND:
-                    joystick.rumble(0.2, 0.2, 200)
-                elif current_gear == Gear.THIRD:
-                    joystick.rumble(0.4, 0.4, 250)
-                logger.info(f"Gear changed to {gear_name(current_gear)}")
-            if buttons["RB"] and not raw["buttons"].get("RB", 0):
-                gear_idx = min(len(GEAR_ORDER) - 1, gear_idx + 1)
-                current_gear = GEAR_ORDER[gear_idx]
-                if current_gear == Gear.FIRST:
-                    joystick.rumble(0.1, 0.1, 150)
-                elif current_gear == Gear.SECOND:
-                    joystick.rumble(0.2, 0.2, 200)
-                elif current_gear == Gear.THIRD:
-                    joystick.rumble(0.4, 0.4, 250)
-                logger.info(f"Gear changed to {gear_name(current_gear)}")
-
-            # ---------- throttle / brake / reverse logic ----------
-            full_brake = False
-            raw_throttle = 0.0
-
-            forward_input = right_trigger_raw
-            brake_input = left_trigger_raw
-
-            if forward_input > DEADZONE_TRIGGER:
-                # moving forward, left trigger subtracts as brake
-                if brake_input > 95 or buttons["A"]:
-                    full_brake = True
-                    raw_throttle = 0.0
+        # background tasks share the loop's lifetime; a failure in any of them stops the car
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(hub.run_writer())
+            if USE_TUI:
+                tg.create_task(status_ui_loop(hub, raw, ui_state))
+            while True:
+                # only axes/buttons that actually moved produce events
+                for ev in _get_events():
+                    if ev.type == pygame.JOYAXISMOTION:
+                        if ev.axis < len(axes):
+                            axes[ev.axis] = ev.value
+                            axes_dirty = True
+                    elif ev.type == pygame.JOYBUTTONDOWN:
+                        buttons_bits = (buttons_bits | 1 << ev.button) & ALL_BUTTONS
+                    elif ev.type == pygame.JOYBUTTONUP:
+                        buttons_bits &= ~(1 << ev.button)
+                if axes_dirty:
+                    axes_dirty = False
+                    lx_f, ly_f, rx_f, ry_f, lt_f, rt_f = axes
+
+                    # sticks with controller deadzone
+                    left_x = _round(lx_f * 100)
+                    left_y = -_round(ly_f * 100)
+                    right_x = _round(rx_f * 100)
+                    right_y = -_round(ry_f * 100)
+                    if -DEADZONE_STICK < left_x < DEADZONE_STICK:
+                        left_x = 0
+                    if -DEADZONE_STICK < left_y < DEADZONE_STICK:
+                        left_y = 0
+                    if -DEADZONE_STICK < right_x < DEADZONE_STICK:
+                        right_x = 0
+                    if -DEADZONE_STICK < right_y < DEADZONE_STICK:
+                        right_y = 0
+
+                    # raw trigger values [0..100]
+                    left_trigger_raw = lt_f * 50 + 50
+                    right_trigger_raw = rt_f * 50 + 50
+
+                # rising button edges since the last processed tick
+                pressed = buttons_bits & ~buttons_old
+                input_sig = (
+                    left_x,
+                    left_y,
+                    right_x,
+                    right_y,
+                    int(left_trigger_raw),
+                    int(right_trigger_raw),
+                    buttons_bits,
+                )
+
+                # mode toggle on X rising edge
+                if pressed & BTN_X:
+                    current_mode_enum = Mode.SPORT if current_mode_enum == Mode.COMFORT else Mode.COMFORT
+                    mode = current_mode_enum.value
+                    alpha_accel = alpha_accel_per_mode[current_mode_enum]
+                    alpha_brake = alpha_brake_per_mode[current_mode_enum]
+                    logger.info(f"Mode switched to {mode}")
+
+                # gear shifting
+                if pressed & BTN_LB:
+                    gear_idx = shift_gear(-1, gear_idx, joystick)
+                if pressed & BTN_RB:
+                    gear_idx = shift_gear(1, gear_idx, joystick)
+                if pressed & (BTN_LB | BTN_RB):
+                    gear_label = GEAR_NAMES[gear_idx]
+                    forward_scale = GEAR_SCALES[gear_idx]
+                    reverse_scale = REVERSE_SCALES[gear_idx]
+                    logger.info(f"Gear changed to {gear_label}")
+
+                # ---------- throttle / brake / reverse logic ----------
+                full_brake = False
+                raw_throttle = 0.0
+
+                forward_input = right_trigger_raw
+                brake_input = left_trigger_raw
+
+                if forward_input > DEADZONE_TRIGGER:
+                    # moving forward, left trigger subtracts as brake
+                    if brake_input > 95 or buttons_bits & BTN_A:
+                        full_brake = True
+                        raw_throttle = 0.0
+                    else:
+                        raw_throttle = forward_input - brake_input
+                        if raw_throttle < 0:
+                            raw_throttle = 0.0  # do not invert here
                 else:
-                    raw_throttle = forward_input - brake_input
-                    if raw_throttle < 0:
-                        raw_throttle = 0.0  # do not invert here
-            else:
-                # no forward: reverse unless full brake by A
-                if buttons["A"]:
-                    full_brake = True
-                    raw_throttle = 0.0
+                    # no forward: reverse unless full brake by A
+                    if buttons_bits & BTN_A:
+                        full_brake = True
+                        raw_throttle = 0.0
+                    else:
+                        raw_throttle = -1 * brake_input
+
+                # apply gear scaling
+                if full_brake:
+                    adjusted_speed = 0.0
                 else:
-                    raw_throttle = -1 * brake_input
-
-            # apply gear scaling
-            if full_brake:
-                adjusted_speed = 0.0
-            else:
-                if raw_throttle >= 0:
-                    adjusted_speed = raw_throttle * GEAR_THROTTLE_SCALE.get(current_gear, 0.0)
+                    if raw_throttle >= 0:
+                        adjusted_speed = raw_throttle * forward_scale
+                    else:
+                        adjusted_speed = -1 * raw_throttle * reverse_scale
+
+                # enforce vehicle inner deadzone: if non-zero but magnitude <10, snap to ±10
+                adjusted_speed = enforce_vehicle_deadzone(adjusted_speed, inner_deadzone=10)
+
+                # steering scaled: 80% stick → full turn
+                steering = int(left_x * STEERING_GAIN)
+                if steering > 100:
+                    steering = 100
+                elif steering < -100:
+                    steering = -100
+
+                # smoothing: accel vs brake
+                if adjusted_speed > smoothed_power:
+                    smoothed_power += (adjusted_speed - smoothed_power) * alpha_accel
                 else:
-                    adjusted_speed = -1 * raw_throttle * REVERSE_SCALE_PER_GEAR.get(current_gear, 0.0)
-
-            # enforce vehicle inner deadzone: if non-zero but magnitude <10, snap to ±10
-            adjusted_speed = enforce_vehicle_deadzone(adjusted_speed, inner_deadzone=10)
-
-            # steering scaled: 80% stick → full turn
-            steering = scale_steering(left_x)
-
-            # smoothing: accel vs brake
-            if adjusted_speed > smoothed_power:
-                alpha = SMOOTH_ALPHA_ACCEL[current_mode_enum]
-                smoothed_power += (adjusted_speed - smoothed_power) * alpha
-            else:
-                alpha = SMOOTH_ALPHA_BRAKE[current_mode_enum]
-                smoothed_power += (adjusted_speed - smoothed_power) * alpha
-            power_to_send = int(smoothed_power)
-
-            # history for averages
-            now = time.time()
-            power_history_full.append((now, smoothed_power))
-            avg_power_full = (
-                sum(p for _, p in power_history_full) / len(power_history_full)
-                if power_history_full
-                else 0.0
-            )
-            recent_history.append((now, smoothed_power))
-            while recent_history and recent_history[0][0] < now - 120:
-                recent_history.popleft()
-            avg_2min = (
-                sum(p for _, p in recent_history) / len(recent_history) if recent_history else 0.0
-            )
-
-            # lights toggle
-            if buttons["Y"] and not toggle_old:
-                lights_enabled = not lights_enabled
-                logger.info(f"Lights set to {lights_enabled}")
-            toggle_old = buttons["Y"]
-
-            brake_active = full_brake
-            lights_code = compute_light_code(brake_active, lights_enabled)
-
-            # drive logic
-            if brake_active and not was_brake:
-                await hub.drive(0, steering, lights_code)
-                throttle_old = 0
-            if not brake_active and was_brake:
-                await hub.drive(power_to_send, steering, lights_code)
-            should_drive = (
-                steering != steering_old
-                or power_to_send != throttle_old
-                or lights_code != lights_old_code
-            )
-            if should_drive:
-                await hub.drive(power_to_send, steering, lights_code)
-
-            throttle_old = power_to_send
-            steering_old = steering
-            lights_old_code = lights_code
-            was_brake = brake_active
-
-            # update raw/command
-            raw["left"] = (left_x, left_y)
-            raw["right"] = (right_x, right_y)
-            raw["triggers"] = (round(left_trigger_raw), round(right_trigger_raw))
-            raw["buttons"] = {k: int(v) for k, v in buttons.items()}
-            command["raw_throttle"] = raw_throttle
-            command["speed"] = power_to_send
-            command["angle"] = steering
-
-            # telemetry payload
-            telemetry = {
-                "power": power_to_send,
-                "instant_power": adjusted_speed,
-                "avg_power_full": avg_power_full,
-                "avg_2min": avg_2min,
-                "gear": gear_name(current_gear),
-                "mode": mode,
-                "raw_left_trigger": round(left_trigger_raw),
-                "raw_right_trigger": round(right_trigger_raw),
-                "angle": steering,
-                "brake": brake_active,
-                "lights": lights_enabled,
-                "buttons": raw["buttons"],
-                "timestamp": now,
-            }
-            asyncio.create_task(broadcast_telemetry(telemetry))
-
-            # UI / log
-            if ENABLE_RICH_LOG:
-                table = build_status_table(
-                    raw=raw,
-                    command=command,
-                    connected=bool(hub.client and getattr(hub.client, "is_connected", False)),
-                    simulate=hub.simulate,
-                    lights_enabled=lights_enabled,
-                    brake=brake_active,
-                    gear=current_gear,
-                    lights_code=lights_code,
-                    power_sent=power_to_send,
-                    instant_power=adjusted_speed,
-                    avg_power_full=avg_power_full,
-                    avg_2min=avg_2min,
-                    mode=mode,
+                    smoothed_power += (adjusted_speed - smoothed_power) * alpha_brake
+                power_to_send = int(smoothed_power)
+
+                # history for averages
+                now = _time()
+                full_count += 1
+                avg_power_full += (smoothed_power - avg_power_full) / full_count
+                recent_history.append((now, smoothed_power))
+                recent_sum += smoothed_power
+                cutoff = now - AVG_WINDOW_SECONDS
+                while recent_history[0][0] < cutoff:
+                    recent_sum -= recent_history.popleft()[1]
+                avg_2min = recent_sum / len(recent_history)
+
+                # idle tick: same inputs and same output power, nothing downstream can change;
+                # skip drive/telemetry/UI work until the next telemetry batch is due
+                if (
+                    input_sig == last_input_sig
+                    and power_to_send == throttle_old
+                    and now - last_batch_t < TELEMETRY_BATCH_INTERVAL
+                ):
+                    await asyncio.sleep(CONTROL_LOOP_INTERVAL)
+                    continue
+                last_input_sig = input_sig
+
+                # lights toggle
+                if pressed & BTN_Y:
+                    lights_enabled = not lights_enabled
+                    logger.info(f"Lights set to {lights_enabled}")
+
+                brake_active = full_brake
+                lights_code = LIGHT_CODE[(brake_active, lights_enabled)]
+
+                # drive logic: at most one command per tick, only when the packed command changes
+                target_speed = 0 if brake_active else power_to_send
+                drive_key = (target_speed & 0xFF) << 16 | (steering & 0xFF) << 8 | lights_code
+                if drive_key != last_drive_key:
+                    hub.request_drive(target_speed, steering, lights_code)
+                    last_drive_key = drive_key
+
+                throttle_old = power_to_send
+
+                # update raw state
+                raw.left_x = left_x
+                raw.left_y = left_y
+                raw.right_x = right_x
+                raw.right_y = right_y
+                left_trigger = _round(left_trigger_raw)
+                right_trigger = _round(right_trigger_raw)
+                raw.lt = left_trigger
+                raw.rt = right_trigger
+                raw.buttons = buttons_bits
+                buttons_old = buttons_bits
+
+                # telemetry payload, only when something visible changed or the heartbeat is due
+                frame_sig = (
+                    power_to_send,
+                    steering,
+                    lights_code,
+                    gear_idx,
+                    mode,
+                    left_trigger,
+                    right_trigger,
+                    buttons_bits,
                 )
-                live_ctx.update(Panel(table, title="Gamepad → Vehicle", border_style="green"))
-            else:
-                logger.info(
-                    f"Gear={gear_name(current_gear)} Mode={mode} Power={power_to_send:.1f} "
-                    f"Avg2min={avg_2min:.1f} Brake={brake_active}"
-                )
-
-            await asyncio.sleep(0.01)
-
-    except KeyboardInterrupt:
+                if frame_sig != last_frame_sig or now - last_frame_t >= TELEMETRY_HEARTBEAT:
+                    last_frame_sig = frame_sig
+                    last_frame_t = now
+                    telemetry = {
+                        "power": power_to_send,
+                        "instant_power": adjusted_speed,
+                        "avg_power_full": avg_power_full,
+                        "avg_2min": avg_2min,
+                        "gear": gear_label,
+                        "mode": mode,
+                        "raw_left_trigger": left_trigger,
+                        "raw_right_trigger": right_trigger,
+                        "angle": steering,
+                        "brake": brake_active,
+                        "lights": lights_enabled,
+                        "buttons": buttons_bits,
+                        "timestamp": now,
+                    }
+                    pending_frames.append(telemetry)
+                    if USE_TUI:
+                        ui_state["frame"] = telemetry
+                if now - last_batch_t >= TELEMETRY_BATCH_INTERVAL:
+                    if pending_frames:
+                        broadcast_telemetry({"type": "multi", "frames": pending_frames})
+                        pending_frames = []
+                    last_batch_t = now
+
+                # status log when the live table is off
+                if (
+                    not USE_TUI
+                    and now - last_log_t >= STATUS_LOG_INTERVAL
+                    and logger.isEnabledFor(logging.INFO)
+                ):
+                    last_log_t = now
+                    logger.info(
+                        "Gear=%s Mode=%s Power=%.1f Avg2min=%.1f Brake=%s",
+                        gear_label,
+                        mode,
+                        power_to_send,
+                        avg_2min,
+                        brake_active,
+                    )
+
+                await asyncio.sleep(CONTROL_LOOP_INTERVAL)
+
+    except asyncio.CancelledError:
         logger.info("Shutting down")
+        raise
     finally:
         await hub.drive(0, 0, 0)
         pygame.quit()
-        if ENABLE_RICH_LOG:
-            live_ctx.__exit__(None, None, None)
 
 
 # ---------- entrypoint ----------
@@ -488,6 +714,8 @@ async def main():
         log_level="warning",
         loop="asyncio",
         lifespan="off",
+        # telemetry frames are small and already compact; skip per-client zlib
+        ws_per_message_deflate=False,
     )
     server = Server(config)
     web = asyncio.create_task(server.serve())
@@ -495,4 +723,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())